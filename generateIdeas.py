@@ -8,9 +8,24 @@ to generate timestamped social media clip ideas.
 
 import os
 from ollama import chat
+from ollama import generate
 from ollama import ChatResponse
 
 
+def preload_model() -> None:
+    """
+    Asks the local Ollama server to load Llama 3.2 into memory without generating
+    anything, so the model is already resident when the first chunk is analysed.
+    Intended to run in the background while the transcript is being produced.
+    """
+    try:
+        # An empty prompt only loads the model; keep it loaded for long transcriptions
+        generate(model='llama3.2', keep_alive='30m')
+    except Exception as e:
+        # Not fatal: the model is loaded on demand by the first chat request instead
+        print(f"Failed to preload Llama 3.2: {e}")
+
+
 def generate_social_media_post_ideas(transcript_chunk: str) -> str:
     """
     Sends a chunk of a transcript to the local Llama 3.2 model to generate social 
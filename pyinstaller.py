@@ -1,8 +1,16 @@
+import os
+
 import PyInstaller.__main__
 
-PyInstaller.__main__.run([
+args = [
     'main.py', # python file where code is
     '--windowed',
     '--noconsole',
     '--icon=tape.icns' # locations of icon
-])
\ No newline at end of file
+]
+
+# Bundle the pre-quantized Whisper model if it has been converted (see README)
+if os.path.isdir('whisper-medium-int8'):
+    args.append(f'--add-data=whisper-medium-int8{os.pathsep}whisper-medium-int8')
+
+PyInstaller.__main__.run(args)
@@ -0,0 +1,93 @@
+"""
+Tests for the transcript helpers in main.py.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import SAMPLE_RATE, merge_chunk_segments, output_paths, split_audio
+
+
+def test_merge_trims_words_repeated_at_chunk_seam():
+    merged = merge_chunk_segments([
+        [{"start": 296.0, "end": 300.2, "text": " and then we went"}],
+        [{"start": 299.7, "end": 302.0, "text": " we went home"}],
+    ])
+
+    assert [segment["text"] for segment in merged] == [" and then we went", " home"]
+    assert merged[1]["start"] == 299.7
+
+
+def test_merge_drops_segment_repeated_entirely_at_chunk_seam():
+    merged = merge_chunk_segments([
+        [{"start": 0.0, "end": 5.0, "text": " Hello there."}],
+        [{"start": 4.6, "end": 5.2, "text": " hello there"}, {"start": 6.0, "end": 8.0, "text": " Next"}],
+    ])
+
+    assert [segment["text"] for segment in merged] == [" Hello there.", " Next"]
+
+
+def test_merge_keeps_segments_that_do_not_overlap():
+    segments = [
+        {"start": 0.0, "end": 2.0, "text": " we went"},
+        {"start": 2.0, "end": 4.0, "text": " we went home"},
+    ]
+
+    assert merge_chunk_segments([segments]) == segments
+
+
+def test_merge_keeps_overlapping_segments_within_one_chunk():
+    segments = [
+        {"start": 0.0, "end": 2.0, "text": " no"},
+        {"start": 1.9, "end": 3.0, "text": " no no I said"},
+    ]
+
+    assert merge_chunk_segments([segments]) == segments
+
+
+def test_merge_only_trims_leading_segments_of_a_chunk():
+    merged = merge_chunk_segments([
+        [{"start": 296.0, "end": 300.2, "text": " and then we went"}],
+        [
+            {"start": 299.7, "end": 302.0, "text": " we went home"},
+            {"start": 302.0, "end": 304.0, "text": " home"},
+            {"start": 303.9, "end": 305.0, "text": " home again"},
+        ],
+    ])
+
+    assert [segment["text"] for segment in merged] == [" and then we went", " home", " home", " home again"]
+
+
+def test_output_paths_replace_only_the_final_extension():
+    assert output_paths("/tmp/a.mp3/foo.MP4") == ("/tmp/a.mp3/foo.srt", "/tmp/a.mp3/foo content ideas.md")
+
+
+def test_output_paths_handle_other_extensions():
+    assert output_paths("talk.wav") == ("talk.srt", "talk content ideas.md")
+
+
+def test_output_paths_handle_names_without_an_extension():
+    assert output_paths("/tmp/episode") == ("/tmp/episode.srt", "/tmp/episode content ideas.md")
+
+
+def test_split_audio_uses_a_single_chunk_for_one_worker():
+    audio = np.zeros(3600 * SAMPLE_RATE, dtype=np.float32)
+
+    chunks = split_audio(audio, 1)
+
+    assert len(chunks) == 1
+    assert chunks[0][0] == 0.0
+    assert len(chunks[0][1]) == len(audio)
+
+
+def test_split_audio_never_exceeds_the_worker_count():
+    audio = np.zeros(3600 * SAMPLE_RATE, dtype=np.float32)
+
+    chunks = split_audio(audio, 4)
+
+    assert len(chunks) == 4
+    assert chunks[1][0] == 899.5